@@ -6,16 +6,162 @@ This example shows how to interact with the mcp-web-scrape server
 from Python applications using HTTP requests.
 
 Requirements:
-    pip install requests aiohttp asyncio
+    pip install requests 'httpx[http2,brotli]' msgspec ijson
 """
 
+import argparse
 import asyncio
-import json
+import atexit
+import itertools
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import (
+    AsyncIterator, Dict, Generic, Iterator, List, NamedTuple, Optional, Any, Tuple, TypeVar, Union
+)
+from urllib.parse import urlparse
 
-import aiohttp
+import httpx
+import ijson
+import msgspec
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Request bodies for parameterless methods never change, so serialize them once
+_LIST_TOOLS_BODY = msgspec.json.encode({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "tools/list"
+})
+_LIST_RESOURCES_BODY = msgspec.json.encode({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "resources/list"
+})
+
+T = TypeVar('T')
+
+
+class Tool(msgspec.Struct):
+    """A tool exposed by the server"""
+    name: str
+    description: Optional[str] = None
+
+
+class Resource(msgspec.Struct, rename="camel"):
+    """A cached resource"""
+    uri: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    mime_type: Optional[str] = None
+
+
+class ToolList(msgspec.Struct):
+    """Result of tools/list"""
+    tools: List[Tool] = []
+
+
+class ResourceList(msgspec.Struct):
+    """Result of resources/list"""
+    resources: List[Resource] = []
+
+
+class RpcResponse(msgspec.Struct, Generic[T]):
+    """JSON-RPC response envelope"""
+    id: Union[int, str, None] = None
+    result: Optional[T] = None
+    error: Optional[Dict[str, Any]] = None
+
+
+# Responses are decoded straight into typed envelopes; a batch may also be
+# rejected as a whole with a single error response
+_TOOLS_DECODER = msgspec.json.Decoder(RpcResponse[ToolList])
+_RESOURCES_DECODER = msgspec.json.Decoder(RpcResponse[ResourceList])
+_CALL_DECODER = msgspec.json.Decoder(RpcResponse[Dict[str, Any]])
+_BATCH_DECODER = msgspec.json.Decoder(
+    Union[List[RpcResponse[Dict[str, Any]]], RpcResponse[Dict[str, Any]]]
+)
+
+
+def _with_extras(arguments: Dict[str, Any], extras: Dict[str, Any]) -> Dict[str, Any]:
+    """Add optional tool arguments, skipping the merge when there are none"""
+    if extras:
+        arguments.update(extras)
+    return arguments
+
+
+def _unwrap(response: RpcResponse) -> Dict[str, Any]:
+    """Return the result of a tool call response, raising on errors"""
+    if response.error is not None:
+        raise Exception(f"Tool call failed: {response.error}")
+    
+    return response.result if response.result is not None else {}
+
+
+def _demux(response: Any, ids: List[Any]) -> List[Union[RpcResponse, Exception]]:
+    """Match the entries of a batch response to their request ids
+    
+    Entries are returned in the order of ``ids``; a missing entry is replaced
+    by an exception. A batch rejected as a whole raises.
+    """
+    if not isinstance(response, list):
+        if response.error is not None:
+            # The server rejected the batch as a whole
+            raise Exception(f"Batch call failed: {response.error}")
+        raise Exception("Batch call failed: expected a batch response, got a single result")
+    
+    by_id = {entry.id: entry for entry in response}
+    return [
+        by_id[request_id] if request_id in by_id
+        else Exception(f"Tool call failed: no response for id {request_id}")
+        for request_id in ids
+    ]
+
+
+# Streamed content items are either plain strings or MCP text objects
+_CONTENT_PREFIXES = ('result.content.item', 'result.content.item.text')
+
+
+class _ContentParser:
+    """Incrementally parse a tool call response into content strings"""
+    
+    def __init__(self):
+        self._events = ijson.sendable_list()
+        self._parser = ijson.parse_coro(self._events, use_float=True)
+        # Rebuilds the error object while its events are being parsed
+        self._error: Optional[ijson.ObjectBuilder] = None
+    
+    def feed(self, chunk: bytes) -> Iterator[str]:
+        """Parse a chunk of the body and yield any completed content items"""
+        self._parser.send(chunk)
+        return self._drain()
+    
+    def close(self) -> Iterator[str]:
+        """Finish parsing and yield any remaining content items"""
+        self._parser.close()
+        return self._drain()
+    
+    def _drain(self) -> Iterator[str]:
+        for prefix, event, value in self._events:
+            if self._error is not None:
+                self._error.event(event, value)
+                if prefix == 'error' and event == 'end_map':
+                    raise Exception(f"Tool call failed: {self._error.value}")
+            elif prefix == 'error' and event == 'start_map':
+                self._error = ijson.ObjectBuilder()
+                self._error.event(event, value)
+            elif event == 'string' and prefix in _CONTENT_PREFIXES:
+                yield value
+        del self._events[:]
+
+
+class StartupResult(NamedTuple):
+    """Results of the combined startup round trip"""
+    health: Dict[str, Any]
+    tools: List[Tool]
+    first_fetch: Dict[str, Any]
 
 
 class MCPWebScrapeClient:
@@ -23,57 +169,149 @@ class MCPWebScrapeClient:
     
     def __init__(self, base_url: str = "http://localhost:3000"):
         self.base_url = base_url.rstrip('/')
+        self._id_counter = itertools.count(1)
         self.session = requests.Session()
         self.session.headers.update({
             'Content-Type': 'application/json',
-            'User-Agent': 'mcp-web-scrape-python-client/1.0'
+            'User-Agent': 'mcp-web-scrape-python-client/1.0',
+            'Accept-Encoding': 'gzip, br',
+            'Connection': 'keep-alive'
         })
+        
+        # Larger pool keeps more keep-alive connections around; transient
+        # gateway errors are retried instead of failing the call
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["POST", "GET"]
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def health_check(self) -> Dict[str, Any]:
         """Check if the server is healthy"""
         response = self.session.get(f"{self.base_url}/health")
         response.raise_for_status()
-        return response.json()
+        return msgspec.json.decode(response.content)
+    
+    def warmup(self, connections: int = 1) -> None:
+        """Open keep-alive connections to the server ahead of a batch
+        
+        Each concurrent health probe leaves one idle connection in the pool,
+        so the first requests of a batch skip connection setup. Target sites
+        are fetched by the server, so only connections to it are warmed.
+        """
+        if connections <= 0:
+            return
+        
+        def probe():
+            try:
+                self.session.get(f"{self.base_url}/health", timeout=2).close()
+            except requests.RequestException:
+                pass
+        
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            for _ in range(connections):
+                executor.submit(probe)
     
-    def list_tools(self) -> List[Dict[str, Any]]:
+    def startup(self, first_url: str, **kwargs) -> StartupResult:
+        """Check health, list tools and fetch a first URL in one round trip
+        
+        The tools/list and fetch calls are sent as a single JSON-RPC batch
+        while the health check runs concurrently in a worker thread.
+        """
+        tools_id = next(self._id_counter)
+        fetch_id = next(self._id_counter)
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": tools_id,
+                "method": "tools/list"
+            },
+            {
+                "jsonrpc": "2.0",
+                "id": fetch_id,
+                "method": "tools/call",
+                "params": {
+                    "name": "fetch",
+                    "arguments": _with_extras({'url': first_url}, kwargs)
+                }
+            }
+        ]
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            health = executor.submit(self.health_check)
+            response = self.session.post(f"{self.base_url}/message", data=msgspec.json.encode(payload))
+            response.raise_for_status()
+            tools, fetch = _demux(
+                _BATCH_DECODER.decode(response.content), [tools_id, fetch_id]
+            )
+            for entry in (tools, fetch):
+                if isinstance(entry, Exception):
+                    raise entry
+            if tools.error is not None:
+                raise Exception(f"Listing tools failed: {tools.error}")
+            
+            return StartupResult(
+                health=health.result(),
+                tools=msgspec.convert(tools.result or {}, ToolList).tools,
+                first_fetch=_unwrap(fetch)
+            )
+    
+    def list_tools(self) -> List[Tool]:
         """List available tools"""
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/list"
-        }
-        response = self.session.post(f"{self.base_url}/message", json=payload)
+        response = self.session.post(f"{self.base_url}/message", data=_LIST_TOOLS_BODY)
         response.raise_for_status()
-        result = response.json()
-        return result.get('result', {}).get('tools', [])
+        result = _TOOLS_DECODER.decode(response.content).result
+        return result.tools if result else []
     
     def fetch_content(self, url: str, **kwargs) -> Dict[str, Any]:
         """Fetch content from a URL"""
-        return self._call_tool('fetch', {'url': url, **kwargs})
+        return self._call_tool('fetch', _with_extras({'url': url}, kwargs))
     
     def extract_content(self, url: str, format: str = 'text', **kwargs) -> Dict[str, Any]:
         """Extract clean content from a URL"""
-        return self._call_tool('extract', {
-            'url': url, 
-            'format': format, 
-            **kwargs
-        })
+        return self._call_tool('extract', _with_extras({'url': url, 'format': format}, kwargs))
+    
+    def extract_content_stream(self, url: str, format: str = 'text', **kwargs) -> Iterator[str]:
+        """Extract clean content from a URL, yielding content items as they arrive
+        
+        The response is parsed incrementally, so callers that only need the
+        start of a large body can stop early without buffering all of it.
+        Stopping early closes the response before it is fully read, so its
+        connection is dropped instead of being returned to the pool; for small
+        bodies, consume the whole stream.
+        """
+        payload = {
+            "jsonrpc": "2.0",
+            "id": next(self._id_counter),
+            "method": "tools/call",
+            "params": {
+                "name": "extract",
+                "arguments": _with_extras({'url': url, 'format': format}, kwargs)
+            }
+        }
+        parser = _ContentParser()
+        with self.session.post(
+            f"{self.base_url}/message", data=msgspec.json.encode(payload), stream=True
+        ) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=65536):
+                yield from parser.feed(chunk)
+        yield from parser.close()
     
     def summarize_content(self, url: str, **kwargs) -> Dict[str, Any]:
         """Summarize content from a URL"""
-        return self._call_tool('summarize', {'url': url, **kwargs})
+        return self._call_tool('summarize', _with_extras({'url': url}, kwargs))
     
-    def list_cache(self) -> List[Dict[str, Any]]:
+    def list_cache(self) -> List[Resource]:
         """List cached resources"""
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "resources/list"
-        }
-        response = self.session.post(f"{self.base_url}/message", json=payload)
+        response = self.session.post(f"{self.base_url}/message", data=_LIST_RESOURCES_BODY)
         response.raise_for_status()
-        result = response.json()
-        return result.get('result', {}).get('resources', [])
+        result = _RESOURCES_DECODER.decode(response.content).result
+        return result.resources if result else []
     
     def purge_cache(self, pattern: Optional[str] = None) -> Dict[str, Any]:
         """Purge cache entries"""
@@ -86,21 +324,16 @@ class MCPWebScrapeClient:
         """Call a specific tool"""
         payload = {
             "jsonrpc": "2.0",
-            "id": int(time.time()),
+            "id": next(self._id_counter),
             "method": "tools/call",
             "params": {
                 "name": tool_name,
                 "arguments": arguments
             }
         }
-        response = self.session.post(f"{self.base_url}/message", json=payload)
+        response = self.session.post(f"{self.base_url}/message", data=msgspec.json.encode(payload))
         response.raise_for_status()
-        result = response.json()
-        
-        if 'error' in result:
-            raise Exception(f"Tool call failed: {result['error']}")
-        
-        return result.get('result', {})
+        return _unwrap(_CALL_DECODER.decode(response.content))
     
     def close(self):
         """Close the session"""
@@ -112,66 +345,100 @@ class AsyncMCPWebScrapeClient:
     
     def __init__(self, base_url: str = "http://localhost:3000"):
         self.base_url = base_url.rstrip('/')
+        self._message_url = f"{self.base_url}/message"
+        self._id_counter = itertools.count(1)
         self.session = None
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
+        # HTTP/2 lets concurrent requests share a single connection
+        self.session = httpx.AsyncClient(
+            http2=True,
             headers={
                 'Content-Type': 'application/json',
-                'User-Agent': 'mcp-web-scrape-python-async-client/1.0'
-            }
+                'User-Agent': 'mcp-web-scrape-python-async-client/1.0',
+                'Accept-Encoding': 'gzip, br'
+            },
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0
         )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
-            await self.session.close()
+            await self.session.aclose()
     
     async def health_check(self) -> Dict[str, Any]:
         """Check if the server is healthy"""
-        async with self.session.get(f"{self.base_url}/health") as response:
-            response.raise_for_status()
-            return await response.json()
+        response = await self.session.get(f"{self.base_url}/health")
+        response.raise_for_status()
+        return msgspec.json.decode(response.content)
     
-    async def list_tools(self) -> List[Dict[str, Any]]:
+    async def warmup(self, connections: int = 1) -> None:
+        """Open keep-alive connections to the server ahead of a batch
+        
+        ``connections`` only matters over HTTP/1.1, where each concurrent
+        probe opens its own connection. Over HTTP/2 (HTTPS servers) all
+        probes share one multiplexed connection, so one probe is enough.
+        """
+        if connections <= 0:
+            return
+        
+        async def probe():
+            try:
+                await self.session.get(f"{self.base_url}/health", timeout=2)
+            except httpx.HTTPError:
+                pass
+        
+        await asyncio.gather(*(probe() for _ in range(connections)))
+    
+    async def list_tools(self) -> List[Tool]:
         """List available tools"""
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/list"
-        }
-        async with self.session.post(f"{self.base_url}/message", json=payload) as response:
-            response.raise_for_status()
-            result = await response.json()
-            return result.get('result', {}).get('tools', [])
+        result = (await self._post(_LIST_TOOLS_BODY, _TOOLS_DECODER)).result
+        return result.tools if result else []
     
     async def fetch_content(self, url: str, **kwargs) -> Dict[str, Any]:
         """Fetch content from a URL"""
-        return await self._call_tool('fetch', {'url': url, **kwargs})
+        return await self._call_tool('fetch', _with_extras({'url': url}, kwargs))
     
     async def extract_content(self, url: str, format: str = 'text', **kwargs) -> Dict[str, Any]:
         """Extract clean content from a URL"""
-        return await self._call_tool('extract', {
-            'url': url, 
-            'format': format, 
-            **kwargs
-        })
-    
-    async def summarize_content(self, url: str, **kwargs) -> Dict[str, Any]:
-        """Summarize content from a URL"""
-        return await self._call_tool('summarize', {'url': url, **kwargs})
+        return await self._call_tool('extract', _with_extras({'url': url, 'format': format}, kwargs))
     
-    async def list_cache(self) -> List[Dict[str, Any]]:
-        """List cached resources"""
+    async def extract_content_stream(
+        self, url: str, format: str = 'text', **kwargs
+    ) -> AsyncIterator[str]:
+        """Extract clean content from a URL, yielding content items as they arrive
+        
+        As with the sync client, stopping early drops the pooled connection.
+        """
         payload = {
             "jsonrpc": "2.0",
-            "id": 1,
-            "method": "resources/list"
+            "id": next(self._id_counter),
+            "method": "tools/call",
+            "params": {
+                "name": "extract",
+                "arguments": _with_extras({'url': url, 'format': format}, kwargs)
+            }
         }
-        async with self.session.post(f"{self.base_url}/message", json=payload) as response:
+        parser = _ContentParser()
+        async with self.session.stream(
+            'POST', self._message_url, content=msgspec.json.encode(payload)
+        ) as response:
             response.raise_for_status()
-            result = await response.json()
-            return result.get('result', {}).get('resources', [])
+            async for chunk in response.aiter_bytes():
+                for item in parser.feed(chunk):
+                    yield item
+        for item in parser.close():
+            yield item
+    
+    async def summarize_content(self, url: str, **kwargs) -> Dict[str, Any]:
+        """Summarize content from a URL"""
+        return await self._call_tool('summarize', _with_extras({'url': url}, kwargs))
+    
+    async def list_cache(self) -> List[Resource]:
+        """List cached resources"""
+        result = (await self._post(_LIST_RESOURCES_BODY, _RESOURCES_DECODER)).result
+        return result.resources if result else []
     
     async def purge_cache(self, pattern: Optional[str] = None) -> Dict[str, Any]:
         """Purge cache entries"""
@@ -180,25 +447,106 @@ class AsyncMCPWebScrapeClient:
             args['pattern'] = pattern
         return await self._call_tool('purge', args)
     
+    async def batch_call(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        batch_size: Optional[int] = None,
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """Call several tools in a single JSON-RPC batch request
+        
+        Results are returned in the same order as ``calls``. Very large
+        batches can be split into chunks of ``batch_size`` calls (at least
+        one), which are sent concurrently. With ``return_exceptions=True``
+        failed calls are returned as exceptions instead of being raised; when
+        a whole chunk fails, every call in that chunk gets the chunk's
+        exception.
+        """
+        payloads = [
+            {
+                "jsonrpc": "2.0",
+                "id": next(self._id_counter),
+                "method": "tools/call",
+                "params": {
+                    "name": tool_name,
+                    "arguments": arguments
+                }
+            }
+            for tool_name, arguments in calls
+        ]
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        
+        size = batch_size or len(payloads) or 1
+        chunks = [payloads[i:i + size] for i in range(0, len(payloads), size)]
+        responses = await asyncio.gather(
+            *(self._dispatch(chunk) for chunk in chunks),
+            return_exceptions=True
+        )
+        
+        results = []
+        for chunk, response in zip(chunks, responses):
+            try:
+                if isinstance(response, BaseException):
+                    raise response
+                entries = _demux(response, [payload['id'] for payload in chunk])
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.extend([e] * len(chunk))
+                continue
+            
+            for entry in entries:
+                try:
+                    if isinstance(entry, Exception):
+                        raise entry
+                    results.append(_unwrap(entry))
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+        return results
+    
     async def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call a specific tool"""
         payload = {
             "jsonrpc": "2.0",
-            "id": int(time.time()),
+            "id": next(self._id_counter),
             "method": "tools/call",
             "params": {
                 "name": tool_name,
                 "arguments": arguments
             }
         }
-        async with self.session.post(f"{self.base_url}/message", json=payload) as response:
-            response.raise_for_status()
-            result = await response.json()
-            
-            if 'error' in result:
-                raise Exception(f"Tool call failed: {result['error']}")
-            
-            return result.get('result', {})
+        return _unwrap(await self._dispatch(payload))
+    
+    async def _dispatch(self, payload: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Any:
+        """Post a single JSON-RPC request or a batch of requests"""
+        decoder = _BATCH_DECODER if isinstance(payload, list) else _CALL_DECODER
+        return await self._post(msgspec.json.encode(payload), decoder)
+    
+    async def _post(self, body: bytes, decoder: msgspec.json.Decoder) -> Any:
+        """Post a serialized JSON-RPC body and decode the buffered response"""
+        response = await self.session.post(self._message_url, content=body)
+        response.raise_for_status()
+        return decoder.decode(response.content)
+
+
+_shared_client: Optional[MCPWebScrapeClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_client() -> MCPWebScrapeClient:
+    """Return a shared synchronous client, creating it on first use
+    
+    Reusing one client keeps its connection pool warm across examples.
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = MCPWebScrapeClient()
+            atexit.register(_shared_client.close)
+    return _shared_client
 
 
 # Example usage functions
@@ -206,30 +554,25 @@ def sync_example():
     """Synchronous usage example"""
     print("=== Synchronous Client Example ===")
     
-    client = MCPWebScrapeClient()
+    client = get_client()
     
     try:
-        # Health check
-        health = client.health_check()
+        # Health check, tool listing and first fetch in a single round trip
+        print("Starting up and fetching content from example.com...")
+        health, tools, fetch_result = client.startup("https://example.com")
         print(f"Server health: {health}")
-        
-        # List available tools
-        tools = client.list_tools()
-        print(f"Available tools: {[tool['name'] for tool in tools]}")
-        
-        # Fetch content
-        print("\nFetching content from example.com...")
-        fetch_result = client.fetch_content("https://example.com")
+        print(f"Available tools: {[tool.name for tool in tools]}")
         print(f"Fetch result keys: {list(fetch_result.keys())}")
         
-        # Extract clean content
+        # Extract clean content; the page is small, so read the whole stream
+        # and keep the connection reusable
         print("\nExtracting clean content...")
-        extract_result = client.extract_content(
+        content = '\n'.join(client.extract_content_stream(
             "https://example.com", 
             format="markdown",
             include_links=True
-        )
-        print(f"Extracted content preview: {extract_result.get('content', [''])[0][:200]}...")
+        ))
+        print(f"Extracted content preview: {content[:200]}...")
         
         # List cache
         cache = client.list_cache()
@@ -244,48 +587,53 @@ def sync_example():
         
     except Exception as e:
         print(f"Error: {e}")
-    finally:
-        client.close()
 
 
-async def async_example():
+async def async_example(client: AsyncMCPWebScrapeClient):
     """Asynchronous usage example"""
     print("\n=== Asynchronous Client Example ===")
     
-    async with AsyncMCPWebScrapeClient() as client:
-        try:
-            # Health check
-            health = await client.health_check()
-            print(f"Server health: {health}")
-            
-            # Concurrent requests
-            urls = [
-                "https://example.com",
-                "https://httpbin.org/html",
-                "https://jsonplaceholder.typicode.com/posts/1"
-            ]
-            
-            print(f"\nFetching {len(urls)} URLs concurrently...")
-            tasks = [client.fetch_content(url) for url in urls]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    print(f"URL {i+1} failed: {result}")
-                else:
-                    print(f"URL {i+1} success: {len(result.get('content', [''])[0])} chars")
-            
-            # List cache after concurrent requests
-            cache = await client.list_cache()
-            print(f"\nCached resources after batch: {len(cache)} items")
-            
-        except Exception as e:
-            print(f"Error: {e}")
+    try:
+        # Health check
+        health = await client.health_check()
+        print(f"Server health: {health}")
+        
+        # Concurrent requests
+        urls = [
+            "https://example.com",
+            "https://httpbin.org/html",
+            "https://jsonplaceholder.typicode.com/posts/1"
+        ]
+        
+        print(f"\nFetching {len(urls)} URLs in a single batch...")
+        results = await client.batch_call(
+            [('fetch', {'url': url}) for url in urls],
+            return_exceptions=True
+        )
+        
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                print(f"URL {i+1} failed: {result}")
+            else:
+                print(f"URL {i+1} success: {len(result.get('content', [''])[0])} chars")
+        
+        # List cache after concurrent requests
+        cache = await client.list_cache()
+        print(f"\nCached resources after batch: {len(cache)} items")
+        
+    except Exception as e:
+        print(f"Error: {e}")
 
 
 def batch_processing_example():
-    """Example of processing multiple URLs"""
-    print("\n=== Batch Processing Example ===")
+    """Example of processing multiple URLs from worker threads
+    
+    Synchronous alternative to batch_processing_example_async for code
+    without an event loop, selected with ``--threaded``. It never runs
+    alongside the async variant, since their per-host limits are independent
+    and would double the load per host.
+    """
+    print("\n=== Threaded Batch Processing Example ===")
     
     urls = [
         "https://news.ycombinator.com",
@@ -293,21 +641,36 @@ def batch_processing_example():
         "https://stackoverflow.com"
     ]
     
-    client = MCPWebScrapeClient()
+    # The shared session is safe to use from several threads
+    client = get_client()
     
-    try:
-        results = []
-        for i, url in enumerate(urls, 1):
-            print(f"Processing {i}/{len(urls)}: {url}")
+    # Connect to the server before the batch starts
+    client.warmup(min(8, len(urls)))
+    
+    # One request at a time per host, different hosts run concurrently
+    host_limits = {urlparse(url).netloc: threading.Semaphore(1) for url in urls}
+    
+    def process(url: str) -> Dict[str, Any]:
+        with host_limits[urlparse(url).netloc]:
             try:
                 # Extract content in markdown format
-                result = client.extract_content(
+                return client.extract_content(
                     url, 
                     format="markdown",
                     include_links=True,
                     include_images=False
                 )
-                
+            finally:
+                # Small delay to be respectful to the same host
+                time.sleep(1)
+    
+    results = []
+    with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+        futures = {executor.submit(process, url): url for url in urls}
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                result = future.result()
                 content = result.get('content', [''])[0]
                 results.append({
                     'url': url,
@@ -315,79 +678,151 @@ def batch_processing_example():
                     'content_length': len(content),
                     'success': True
                 })
-                
-                print(f"  ✓ Success: {len(content)} characters")
+                print(f"  ✓ {url}: {len(content)} characters")
                 
             except Exception as e:
-                print(f"  ✗ Failed: {e}")
+                print(f"  ✗ {url}: {e}")
                 results.append({
                     'url': url,
                     'error': str(e),
                     'success': False
                 })
-            
-            # Small delay to be respectful
-            time.sleep(1)
-        
-        # Summary
-        successful = sum(1 for r in results if r['success'])
-        print(f"\nBatch complete: {successful}/{len(urls)} successful")
-        
-        # Show cache status
-        cache = client.list_cache()
-        print(f"Cache now contains: {len(cache)} items")
-        
-    finally:
-        client.close()
+    
+    # Summary
+    successful = sum(1 for r in results if r['success'])
+    print(f"\nThreaded batch complete: {successful}/{len(urls)} successful")
+    
+    # Show cache status
+    cache = client.list_cache()
+    print(f"Cache now contains: {len(cache)} items")
 
 
-def cache_management_example():
-    """Example of cache management"""
-    print("\n=== Cache Management Example ===")
+async def batch_processing_example_async(client: AsyncMCPWebScrapeClient):
+    """Example of processing multiple URLs"""
+    print("\n=== Batch Processing Example ===")
+    
+    urls = [
+        "https://news.ycombinator.com",
+        "https://github.com",
+        "https://stackoverflow.com"
+    ]
     
-    client = MCPWebScrapeClient()
+    # One request at a time per host, different hosts run concurrently
+    host_limits = {urlparse(url).netloc: asyncio.Semaphore(1) for url in urls}
     
-    try:
-        # Check initial cache
-        cache = client.list_cache()
-        print(f"Initial cache: {len(cache)} items")
-        
-        # Fetch some content to populate cache
-        print("\nPopulating cache...")
-        test_urls = [
-            "https://example.com",
-            "https://httpbin.org/html"
-        ]
-        
-        for url in test_urls:
+    # Connect to the server before the batch starts; one connection per URL
+    # over HTTP/1.1, a single shared connection over HTTP/2
+    await client.warmup(len(urls))
+    
+    async def process(url: str) -> Dict[str, Any]:
+        async with host_limits[urlparse(url).netloc]:
             try:
-                client.fetch_content(url)
-                print(f"  ✓ Cached: {url}")
+                # Extract content in markdown format
+                result = await client.extract_content(
+                    url, 
+                    format="markdown",
+                    include_links=True,
+                    include_images=False
+                )
+                
+                content = result.get('content', [''])[0]
+                print(f"  ✓ {url}: {len(content)} characters")
+                return {
+                    'url': url,
+                    'title': result.get('title', 'Unknown'),
+                    'content_length': len(content),
+                    'success': True
+                }
+                
             except Exception as e:
-                print(f"  ✗ Failed: {url} - {e}")
-        
-        # Check cache after population
-        cache = client.list_cache()
-        print(f"\nCache after population: {len(cache)} items")
-        
-        # Show cache details
-        for item in cache:
-            print(f"  - {item.get('uri', 'Unknown')}: {item.get('name', 'No name')}")
-        
-        # Purge specific items
-        print("\nPurging example.com from cache...")
-        purge_result = client.purge_cache("example.com")
-        print(f"Purge result: {purge_result}")
+                print(f"  ✗ {url}: {e}")
+                return {
+                    'url': url,
+                    'error': str(e),
+                    'success': False
+                }
+            finally:
+                # Small delay to be respectful to the same host
+                await asyncio.sleep(1)
+    
+    print(f"Processing {len(urls)} URLs...")
+    results = await asyncio.gather(*(process(url) for url in urls))
+    
+    # Summary
+    successful = sum(1 for r in results if r['success'])
+    print(f"\nBatch complete: {successful}/{len(urls)} successful")
+    
+    # Show cache status
+    cache = await client.list_cache()
+    print(f"Cache now contains: {len(cache)} items")
+
+
+async def cache_management_example_async(client: AsyncMCPWebScrapeClient):
+    """Example of cache management"""
+    print("\n=== Cache Management Example ===")
+    
+    # Check initial cache
+    cache = await client.list_cache()
+    print(f"Initial cache: {len(cache)} items")
+    
+    # Fetch some content to populate cache
+    print("\nPopulating cache...")
+    test_urls = [
+        "https://example.com",
+        "https://httpbin.org/html"
+    ]
+    
+    for url in test_urls:
+        try:
+            await client.fetch_content(url)
+            print(f"  ✓ Cached: {url}")
+        except Exception as e:
+            print(f"  ✗ Failed: {url} - {e}")
+    
+    # Check cache after population
+    cache = await client.list_cache()
+    print(f"\nCache after population: {len(cache)} items")
+    
+    # Show cache details
+    for item in cache:
+        print(f"  - {item.uri}: {item.name or 'No name'}")
+    
+    # Purge specific items
+    print("\nPurging example.com from cache...")
+    purge_result = await client.purge_cache("example.com")
+    print(f"Purge result: {purge_result}")
+    
+    # Check cache after purge
+    cache = await client.list_cache()
+    print(f"Cache after purge: {len(cache)} items")
+
+
+async def _run_all(threaded_batch: bool = False):
+    """Run the examples concurrently over a single async client"""
+    async with AsyncMCPWebScrapeClient() as client:
+        await async_example(client)
         
-        # Check cache after purge
-        cache = client.list_cache()
-        print(f"Cache after purge: {len(cache)} items")
+        # These examples mostly wait on I/O and touch different pages
+        if threaded_batch:
+            batch = asyncio.to_thread(batch_processing_example)
+        else:
+            batch = batch_processing_example_async(client)
+        await asyncio.gather(asyncio.to_thread(sync_example), batch)
         
-    finally:
-        client.close()
+        # Cache management inspects and purges the shared server cache, so it
+        # runs on its own once the other examples are done
+        await cache_management_example_async(client)
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--threaded',
+        action='store_true',
+        help='run the threaded sync batch example instead of the async one'
+    )
+    args = parser.parse_args()
+    
     print("MCP Web Scrape Python Client Examples")
     print("=====================================")
     print("Make sure the mcp-web-scrape server is running on http://localhost:3000")
@@ -396,10 +831,7 @@ if __name__ == "__main__":
     
     # Run examples
     try:
-        sync_example()
-        asyncio.run(async_example())
-        batch_processing_example()
-        cache_management_example()
+        asyncio.run(_run_all(threaded_batch=args.threaded))
         
         print("\n=== All Examples Complete ===")
         
@@ -407,4 +839,4 @@ if __name__ == "__main__":
         print("\nExamples interrupted by user")
     except Exception as e:
         print(f"\nExample failed: {e}")
-        print("Make sure the mcp-web-scrape server is running!")
\ No newline at end of file
+        print("Make sure the mcp-web-scrape server is running!")